@@ -23,16 +23,25 @@ Usage:
     python metrology/calibrate_synth.py --dry-run
     python metrology/calibrate_synth.py --auto-save
     python metrology/calibrate_synth.py --target-ppb 50
+    python metrology/calibrate_synth.py --cross-check-freqs 50e6,110e6
 """
 
 import sys
 import os
 import json
+import math
 import time
+import atexit
+import socket
 import argparse
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # optional — falls back to the stdlib json encoder
+    orjson = None
+
 # Add parent directory for fpga_driver import
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -45,40 +54,113 @@ MEASURE_FREQ_HZ = DEMOD_FREQUENCY_HZ   # 62.5 MHz — delta_f = 0 Hz when on fre
 AMPLITUDE_DBM = 3.0
 DEFAULT_TARGET_PPB = 100                # default convergence target
 DAC_SETTLE_S = 2                        # settling after DAC change (TCXO tuning)
+DAC_SETTLE_MIN_S = 0.2                  # settling floor for tiny DAC steps
+DAC_SETTLE_S_PER_STEP = 0.1             # settling per CDAC step (or per 10 FDAC steps)
 DISCARD_FIRST_SAMPLES = 2              # transient guard
+CROSS_CHECK_FREQS = (110e6, 10e6)       # phase 4 cross-check frequencies (INT mode)
+EXT_REF_STATE_PATH = os.path.join(os.path.dirname(__file__), 'data', 'ext_ref_state.json')
+EXT_REF_STATE_TTL_S = 24 * 3600         # reuse a clean EXT10DIR check for this long
+EXT_REF_CACHE_MAX_HZ = 0.5              # only reuse checks closer than this to 0 Hz
+DELTAF_WAIT_TIMEOUT_S = 1.5             # max wait for the next 1 Hz delta-f sample
+HISTORY_POLL_S = 0.2                    # poll period when the driver cannot block
+MEAS_CACHE_TTL_S = 60                   # reuse a phase-3 measurement for this long
+HZ_PER_FDAC_PRIOR = MEASURE_FREQ_HZ * 0.44e-9  # ≈0.0275 Hz/FDAC step (0.44 ppb/LSB)
+FDAC_SEARCH_HALF_WIDTH = 32             # FDAC bracket around the prior's prediction
 
 
 # ── Connection helpers (from metrology_measure.py) ───────────────────
 
 MAX_RECONNECT_ATTEMPTS = 3
 RECONNECT_DELAY_S = 5
+FPGA_RECONNECT_BACKOFF_S = 0.1          # first FPGA retry delay, ×3 per attempt
+
+
+def tune_fpga_socket(fpga):
+    """Disable Nagle and enable keepalive on the driver's TCP socket.
+
+    Every delta-f history poll is a tiny request, so Nagle's algorithm
+    would add up to ~40 ms per round-trip.
+
+    Returns:
+        True if the socket options were applied
+    """
+    sock = getattr(fpga, '_socket', None)
+    if sock is None:
+        return False
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):  # Linux only
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        return False
+    return True
 
 
 def connect_fpga(host, port):
-    """Connect to Alpha250 with retry logic."""
+    """Connect to Alpha250 with retry logic (exponential backoff: 0.1, 0.3 s...)."""
     from fpga_driver import FPGADriver
     for attempt in range(1, MAX_RECONNECT_ATTEMPTS + 1):
         try:
             fpga = FPGADriver(host=host, auto_connect=True, port=port)
             if fpga.is_connected():
+                tune_fpga_socket(fpga)
                 return fpga
         except Exception as e:
             print(f"  FPGA connection attempt {attempt}/{MAX_RECONNECT_ATTEMPTS} failed: {e}")
             if attempt < MAX_RECONNECT_ATTEMPTS:
-                time.sleep(RECONNECT_DELAY_S)
+                time.sleep(FPGA_RECONNECT_BACKOFF_S * 3 ** (attempt - 1))
     raise ConnectionError(f"Failed to connect to FPGA at {host}:{port}")
 
 
+def set_usb_serial_latency_timer(port, latency_ms=1):
+    """Lower the FTDI latency timer of a USB-serial port (Linux sysfs).
+
+    The default 16 ms timer delays every SCPI reply. Writing the sysfs
+    attribute needs root; to make it persistent, add a udev rule:
+
+        ACTION=="add", SUBSYSTEM=="usb-serial", DRIVERS=="ftdi_sio", ATTR{latency_timer}="1"
+
+    Returns:
+        True if the timer was set, False if unavailable (not FTDI, no permission)
+    """
+    dev = os.path.basename(os.path.realpath(port))
+    path = f'/sys/bus/usb-serial/devices/{dev}/latency_timer'
+    try:
+        with open(path, 'w') as f:
+            f.write(str(latency_ms))
+    except OSError:
+        return False
+    return True
+
+
 def connect_synth(port):
-    """Connect to IFR2023A with retry logic."""
+    """Connect to IFR2023A with retry logic.
+
+    *IDN? and DIAG:CAL:FST:DATE? go out as one compound query. The date is
+    None if the instrument did not answer it (e.g. Level 2 locked); if the
+    whole compound reply is lost, *IDN? is asked again on its own.
+
+    Returns:
+        (synth, idn, cal_date)
+    """
     sys.path.insert(0, '/home/manip/src/ifr2023')
     from ifr2023a import IFR2023A
+    if set_usb_serial_latency_timer(port):
+        print(f"  {port}: USB-serial latency timer set to 1 ms")
     for attempt in range(1, MAX_RECONNECT_ATTEMPTS + 1):
         try:
             synth = IFR2023A(port=port)
-            idn = synth.idn()
+            try:
+                replies = synth.query_multi(["*IDN?", "DIAG:CAL:FST:DATE?"])
+            except TimeoutError:
+                # A failing DATE? can suppress the whole reply line; phase 0
+                # reports the Level 2 problem itself
+                replies = [synth.idn()]
+            idn = replies[0]
+            cal_date = replies[1] if len(replies) > 1 and replies[1] else None
             print(f"  Synth IDN: {idn}")
-            return synth, idn
+            return synth, idn, cal_date
         except Exception as e:
             print(f"  Synth connection attempt {attempt}/{MAX_RECONNECT_ATTEMPTS} failed: {e}")
             if attempt < MAX_RECONNECT_ATTEMPTS:
@@ -98,65 +180,132 @@ def disable_servo_ch1(fpga):
 
 
 def flush_history(fpga):
-    """Drain the delta-f history buffer and return last sequence counter."""
-    last_seq = 0
-    for _ in range(5):
-        samples = fpga.get_deltaf_history_since(last_seq)
-        if not samples:
-            break
-        last_seq = samples[-1]['seq_counter']
-        time.sleep(0.2)
-    return last_seq
+    """Skip past the buffered delta-f history and return last sequence counter.
+
+    The driver keeps the history ring itself, so one query is enough to
+    learn the latest sequence counter.
+    """
+    samples = fpga.get_deltaf_history_since(0)
+    return samples[-1]['seq_counter'] if samples else 0
+
+
+def wait_for_deltaf_samples(fpga, since_seq, min_count=1, timeout_s=DELTAF_WAIT_TIMEOUT_S):
+    """Wait until at least min_count delta-f samples newer than since_seq exist.
+
+    Uses the driver's blocking wait_for_deltaf_samples() when it provides
+    one, otherwise falls back to polling every HISTORY_POLL_S.
+
+    Returns:
+        List of new samples (shorter than min_count on timeout)
+    """
+    wait = getattr(fpga, 'wait_for_deltaf_samples', None)
+    if wait is not None:
+        return wait(since_seq, min_count, timeout_s)
+
+    deadline = time.time() + timeout_s
+    while True:
+        samples = fpga.get_deltaf_history_since(since_seq)
+        remaining = deadline - time.time()
+        if len(samples) >= min_count or remaining <= 0:
+            return samples
+        time.sleep(min(HISTORY_POLL_S, remaining))
 
 
-def measure_offset(fpga, duration_s, label=""):
+def measure_offset(fpga, max_duration_s, required_se_hz=None, min_samples=5, label="",
+                   last_seq=None):
     """Measure the mean delta-f offset on channel 1 (PI mode).
 
+    Mean and variance are updated online (Welford) as samples arrive, so no
+    sample list is kept. The measurement stops early once the standard error
+    of the mean is good enough.
+
     Args:
         fpga: Connected FPGADriver
-        duration_s: Number of 1-second samples to collect
+        max_duration_s: Maximum number of 1-second samples to collect
+        required_se_hz: Stop early once the standard error of the mean drops
+            below this (None = always collect max_duration_s samples)
+        min_samples: Minimum number of samples before stopping early
         label: Optional label for progress display
+        last_seq: Sequence counter to start from (e.g. from set_dac_and_settle),
+            or None to skip past the buffered history first
 
     Returns:
         (mean_hz, std_hz, n_samples) or raises if insufficient data
     """
     prefix = f"  [{label}] " if label else "  "
-    last_seq = flush_history(fpga)
+    if last_seq is None:
+        last_seq = flush_history(fpga)
 
-    values = []
     raw_count = 0
-    t0 = time.time()
-
-    while time.time() - t0 < duration_s + DISCARD_FIRST_SAMPLES + 5:
-        new = fpga.get_deltaf_history_since(last_seq)
+    n, mean, m2 = 0, 0.0, 0.0  # Welford accumulators
+    deadline = time.time() + max_duration_s + DISCARD_FIRST_SAMPLES + 5
+
+    while n < max_duration_s and time.time() < deadline:
+        new = wait_for_deltaf_samples(fpga, last_seq, 1, DELTAF_WAIT_TIMEOUT_S)
+        if not new:
+            continue
+        last_seq = new[-1]['seq_counter']
         for s in new:
             raw_count += 1
-            last_seq = s['seq_counter']
-            if raw_count <= DISCARD_FIRST_SAMPLES:
+            if raw_count <= DISCARD_FIRST_SAMPLES or n >= max_duration_s:
                 continue
-            values.append(s['avg1_hz'])
-
-        n = len(values)
-        print(f"\r{prefix}Measuring {n}/{duration_s}s...", end='', flush=True)
-        if n >= duration_s:
-            break
-        time.sleep(0.2)
+            x = s['avg1_hz']
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+
+        print(f"\r{prefix}Measuring {n}/{max_duration_s}s...", end='', flush=True)
+        if required_se_hz is not None and n >= max(min_samples, 2):
+            if math.sqrt(m2 / (n * (n - 1))) < required_se_hz:
+                break
     print()
 
-    if len(values) < 3:
-        raise RuntimeError(f"Insufficient samples: got {len(values)}, need at least 3")
+    if n < 3:
+        raise RuntimeError(f"Insufficient samples: got {n}, need at least 3")
 
-    arr = np.array(values)
-    return float(np.mean(arr)), float(np.std(arr)), len(values)
+    return mean, math.sqrt(m2 / n), n
 
 
-def set_dac_and_settle(synth, cdac=None, fdac=None):
-    """Write DAC value(s) and wait for TCXO settling. Must be in cal mode."""
-    if cdac is not None:
+def set_dac_and_settle(fpga, synth, cdac=None, fdac=None, prev_cdac=None, prev_fdac=None):
+    """Write DAC value(s) and wait for TCXO settling. Must be in cal mode.
+
+    The settling time scales with the size of the step (one CDAC step
+    weighs as much as ten FDAC steps), clamped to
+    [DAC_SETTLE_MIN_S, DAC_SETTLE_S]. A DAC written without its previous
+    value always gets the full DAC_SETTLE_S.
+
+    The delta-f stream keeps being drained while the TCXO settles, so the
+    returned sequence counter can be handed straight to measure_offset().
+
+    Returns:
+        Last delta-f sequence counter seen at the end of the settling time
+    """
+    last_seq = flush_history(fpga)
+    if cdac is not None and fdac is not None:
+        synth.cal_fst_set_dacs(cdac, fdac)
+    elif cdac is not None:
         synth.cal_fst_set_coarse_dac(cdac)
-    if fdac is not None:
+    elif fdac is not None:
         synth.cal_fst_set_fine_dac(fdac)
-    time.sleep(DAC_SETTLE_S)
+
+    delta = 0.0
+    for value, prev, weight in ((cdac, prev_cdac, 1.0), (fdac, prev_fdac, 0.1)):
+        if value is not None:
+            delta = max(delta, math.inf if prev is None else weight * abs(value - prev))
+    settle_s = min(DAC_SETTLE_S, max(DAC_SETTLE_MIN_S, DAC_SETTLE_S_PER_STEP * delta))
+
+    t_end = time.time() + settle_s
+    while time.time() < t_end:
+        new = wait_for_deltaf_samples(fpga, last_seq, 1, max(0.0, t_end - time.time()))
+        if new:
+            last_seq = new[-1]['seq_counter']
+    return last_seq
+
+
+def _clip_u8(x):
+    """Clamp a DAC value to the 8-bit range [0, 255]."""
+    return 0 if x < 0 else (255 if x > 255 else int(x))
 
 
 def hz_to_ppb(offset_hz, carrier_hz=MEASURE_FREQ_HZ):
@@ -169,6 +318,78 @@ def ppb_to_hz(ppb, carrier_hz=MEASURE_FREQ_HZ):
     return ppb * carrier_hz / 1e9
 
 
+# ── FDAC search ──────────────────────────────────────────────────────
+
+class _SlopeSignFlipped(Exception):
+    """Raised from a phase-3 measurement to abandon a search centred with the wrong slope sign."""
+
+
+def golden_section_fdac(measure, target_hz, lo=0, hi=255, known=None, slope_sign=None):
+    """Golden-section search for the FDAC value minimizing |offset|.
+
+    Each step shrinks the bracket by 1/φ and reuses one of the two interior
+    points, so only one new measurement is needed per step. Interior points
+    are placed symmetrically in the bracket so integer rounding never breaks
+    that reuse.
+
+    Args:
+        measure: Callable fdac -> offset_hz (sets the DAC and measures)
+        target_hz: Stop early once |offset| falls below this
+        lo, hi: Initial FDAC bracket (inclusive)
+        known: Optional {fdac: offset_hz} of points already measured
+        slope_sign: Sign of d(offset)/d(FDAC) if known (+1/-1). The final
+            probe then only checks the neighbor on the zero-crossing side
+
+    Returns:
+        (best_fdac, best_offset_hz) over all measured points
+    """
+    inv_phi = 2 / (1 + 5 ** 0.5)
+    measured = dict(known or {})
+
+    def evaluate(x):
+        if x not in measured:
+            measured[x] = measure(x)
+        return abs(measured[x])
+
+    def converged():
+        return min(abs(v) for v in measured.values()) < target_hz
+
+    a, b = lo, hi
+    x1 = b - round((b - a) * inv_phi)
+    x2 = a + b - x1
+    if x2 == x1:
+        x2 = x1 + 1
+    while b - a > 2 and not (measured and converged()):
+        if evaluate(x1) <= evaluate(x2):
+            b, keep = x2, x1
+        else:
+            a, keep = x1, x2
+        # New point mirrors the kept one so the bracket stays symmetric
+        other = a + b - keep
+        if other == keep:
+            other = keep + 1
+        x1, x2 = min(keep, other), max(keep, other)
+
+    # Bracket is down to ≤ 3 adjacent values
+    if slope_sign is None:
+        for x in range(a, b + 1):
+            if measured and converged():
+                break
+            evaluate(x)
+    elif not (measured and converged()):
+        # Offset is monotone, so only the best point's neighbor toward the
+        # zero crossing can improve on it
+        if not measured:
+            evaluate((a + b) // 2)
+        best_fdac = min(measured, key=lambda x: abs(measured[x]))
+        neighbor = best_fdac - 1 if measured[best_fdac] * slope_sign > 0 else best_fdac + 1
+        if lo <= neighbor <= hi and not converged():
+            evaluate(neighbor)
+
+    best_fdac = min(measured, key=lambda x: abs(measured[x]))
+    return best_fdac, measured[best_fdac]
+
+
 # ── Data file I/O ────────────────────────────────────────────────────
 
 def generate_data_path():
@@ -177,29 +398,88 @@ def generate_data_path():
     return os.path.join(os.path.dirname(__file__), 'data', f'calibration_{ts}.json')
 
 
-def save_data(data, filepath):
-    """Atomic save: write to .tmp then rename."""
+# Single worker: saves are written in submission order, off the measurement thread
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='save_data')
+atexit.register(_save_pool.shutdown, wait=True)
+
+
+def _write_atomic(filepath, payload):
+    """Write bytes to .tmp, fsync, then rename over filepath."""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     tmp = filepath + '.tmp'
-    with open(tmp, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp, filepath)
 
 
+def _report_save_error(future):
+    if future.exception() is not None:
+        print(f"\n  WARNING: Failed to save calibration data: {future.exception()}")
+
+
+def save_data(data, filepath):
+    """Atomic save in the background: write to .tmp then rename.
+
+    The data is serialized on the calling thread, so later changes to
+    `data` cannot race with the write.
+
+    Returns:
+        Future of the background write
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    future = _save_pool.submit(_write_atomic, filepath, payload)
+    future.add_done_callback(_report_save_error)
+    return future
+
+
+def load_ext_ref_state():
+    """Return the last EXT10DIR check if it is recent and clean, else None.
+
+    The state is only reused when younger than EXT_REF_STATE_TTL_S and
+    |mean_hz| < EXT_REF_CACHE_MAX_HZ; anything else forces a new check.
+    """
+    try:
+        with open(EXT_REF_STATE_PATH) as f:
+            state = json.load(f)
+        last_check = datetime.fromisoformat(state['last_check_utc'])
+        age_s = (datetime.now(timezone.utc) - last_check).total_seconds()
+        fresh = 0 <= age_s < EXT_REF_STATE_TTL_S and abs(state['mean_hz']) < EXT_REF_CACHE_MAX_HZ
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return state if fresh else None
+
+
+def save_ext_ref_state(mean_hz, std_hz):
+    """Record a fresh EXT10DIR measurement for load_ext_ref_state()."""
+    save_data({
+        'last_check_utc': datetime.now(timezone.utc).isoformat(),
+        'mean_hz': mean_hz, 'std_hz': std_hz,
+    }, EXT_REF_STATE_PATH)
+
+
 # ── Calibration phases ───────────────────────────────────────────────
 
-def phase0_verify(fpga, synth, data):
-    """Phase 0: Initial verification and baseline measurement (before cal mode)."""
+def phase0_verify(fpga, synth, data, use_ext_cache=True):
+    """Phase 0: Initial verification and baseline measurement (before cal mode).
+
+    The EXT10DIR reference check is skipped when a check from the last
+    EXT_REF_STATE_TTL_S was within EXT_REF_CACHE_MAX_HZ (see load_ext_ref_state).
+    """
     print(f"\n{'='*70}")
     print("PHASE 0 — Initial verification")
     print(f"{'='*70}")
 
     phase = {'name': 'phase0_verify'}
 
-    # Check Level 2 access
+    # Check Level 2 access (date already read at connect time if it answered)
     print("  Checking Level 2 access (DIAG:CAL:FST:DATE?)...")
     try:
-        cal_date = synth.cal_fst_get_date()
+        cal_date = data['metadata'].get('synth_cal_date') or synth.cal_fst_get_date()
         print(f"    Last calibration date: {cal_date}")
         phase['last_cal_date'] = cal_date
     except Exception as e:
@@ -207,13 +487,24 @@ def phase0_verify(fpga, synth, data):
         print("  → Unlock Level 2 on the front panel: UTIL 80, password 123456")
         raise RuntimeError("Level 2 access required. Use UTIL 80, password 123456.")
 
-    # EXT10DIR reference check
-    print("\n  Reference check: EXT10DIR mode, 10s measurement...")
-    synth.set_clock_external_10mhz_direct()
-    time.sleep(2.0)
-    mean_ext, std_ext, n_ext = measure_offset(fpga, 10, "EXT ref check")
-    print(f"    EXT10DIR: {format_deltaf(mean_ext)} ± {format_deltaf(std_ext)} (n={n_ext})")
-    phase['ext_check'] = {'mean_hz': mean_ext, 'std_hz': std_ext, 'n': n_ext}
+    # EXT10DIR reference check (reused if a recent check was clean)
+    ext_state = load_ext_ref_state() if use_ext_cache else None
+    if ext_state is not None:
+        mean_ext, std_ext = ext_state['mean_hz'], ext_state['std_hz']
+        print(f"\n  Reference check: reusing EXT10DIR check from {ext_state['last_check_utc']}")
+        print(f"    EXT10DIR: {format_deltaf(mean_ext)} ± {format_deltaf(std_ext)} (cached)")
+        phase['ext_check'] = {
+            'mean_hz': mean_ext, 'std_hz': std_ext,
+            'last_check_utc': ext_state['last_check_utc'], 'cached': True,
+        }
+    else:
+        print("\n  Reference check: EXT10DIR mode, 10s measurement...")
+        synth.set_clock_external_10mhz_direct()
+        time.sleep(2.0)
+        mean_ext, std_ext, n_ext = measure_offset(fpga, 10, label="EXT ref check")
+        print(f"    EXT10DIR: {format_deltaf(mean_ext)} ± {format_deltaf(std_ext)} (n={n_ext})")
+        phase['ext_check'] = {'mean_hz': mean_ext, 'std_hz': std_ext, 'n': n_ext}
+        save_ext_ref_state(mean_ext, std_ext)
 
     if abs(mean_ext) > 1.0:
         print(f"  WARNING: EXT10DIR offset = {format_deltaf(mean_ext)}, expected ~0 Hz")
@@ -223,7 +514,7 @@ def phase0_verify(fpga, synth, data):
     print("\n  Baseline measurement: INT mode, 30s...")
     synth.set_clock_internal()
     time.sleep(2.0)
-    mean_int, std_int, n_int = measure_offset(fpga, 30, "INT baseline")
+    mean_int, std_int, n_int = measure_offset(fpga, 30, label="INT baseline")
     ppb_initial = hz_to_ppb(mean_int)
     print(f"    INT offset: {format_deltaf(mean_int)} = {ppb_initial:+.1f} ppb (n={n_int})")
     phase['int_baseline'] = {'mean_hz': mean_int, 'std_hz': std_int, 'n': n_int, 'ppb': ppb_initial}
@@ -241,11 +532,12 @@ def phase1_cdac_sensitivity(fpga, synth, data, cdac, fdac):
     phase = {'name': 'phase1_cdac_sensitivity'}
 
     # Set FDAC to midrange for sensitivity measurement
+    last_seq = None
     if fdac != 128:
         print(f"  Setting FDAC=128 (was {fdac}) for sensitivity measurement...")
-        set_dac_and_settle(synth, fdac=128)
+        last_seq = set_dac_and_settle(fpga, synth, fdac=128, prev_fdac=fdac)
 
-    mean_a, std_a, _ = measure_offset(fpga, 15, f"CDAC={cdac}")
+    mean_a, std_a, _ = measure_offset(fpga, 15, label=f"CDAC={cdac}", last_seq=last_seq)
     phase['point_a'] = {'cdac': cdac, 'fdac': 128, 'mean_hz': mean_a, 'std_hz': std_a}
     print(f"    CDAC={cdac}, FDAC=128: {format_deltaf(mean_a)}")
 
@@ -256,8 +548,8 @@ def phase1_cdac_sensitivity(fpga, synth, data, cdac, fdac):
         cdac_b = max(cdac - 10, 0)
         delta_cdac = cdac_b - cdac
 
-    set_dac_and_settle(synth, cdac=cdac_b)
-    mean_b, std_b, _ = measure_offset(fpga, 15, f"CDAC={cdac_b}")
+    last_seq = set_dac_and_settle(fpga, synth, cdac=cdac_b, prev_cdac=cdac)
+    mean_b, std_b, _ = measure_offset(fpga, 15, label=f"CDAC={cdac_b}", last_seq=last_seq)
     phase['point_b'] = {'cdac': cdac_b, 'fdac': 128, 'mean_hz': mean_b, 'std_hz': std_b}
     print(f"    CDAC={cdac_b}, FDAC=128: {format_deltaf(mean_b)}")
 
@@ -266,14 +558,38 @@ def phase1_cdac_sensitivity(fpga, synth, data, cdac, fdac):
     print(f"    Sensitivity: {hz_per_cdac:+.3f} Hz/CDAC step ({hz_to_ppb(hz_per_cdac):+.1f} ppb/step)")
 
     # Restore original CDAC
-    set_dac_and_settle(synth, cdac=cdac)
+    set_dac_and_settle(fpga, synth, cdac=cdac, prev_cdac=cdac_b)
 
     data['phases'].append(phase)
     return hz_per_cdac, mean_a  # mean_a is the offset at (cdac, 128)
 
 
+def newton_step(offset_hz, hz_per_cdac, cdac, fdac):
+    """Joint DAC correction: whole CDAC steps, FDAC takes the remainder.
+
+    Returns:
+        (new_cdac, new_fdac, residual_hz) where residual_hz is the part of
+        the correction left to FDAC
+    """
+    hz_per_fdac = math.copysign(HZ_PER_FDAC_PRIOR, hz_per_cdac)
+    ideal_hz = -offset_hz
+    new_cdac = _clip_u8(cdac + round(ideal_hz / hz_per_cdac))
+    residual_hz = ideal_hz - (new_cdac - cdac) * hz_per_cdac
+    new_fdac = _clip_u8(round(fdac + residual_hz / hz_per_fdac))
+    return new_cdac, new_fdac, residual_hz
+
+
 def phase2_coarse_correction(fpga, synth, data, offset_hz, hz_per_cdac, cdac, coarse_threshold_hz):
-    """Phase 2: Coarse DAC correction (skip if already within threshold). Must be in cal mode."""
+    """Phase 2: Coarse DAC correction (skip if already within threshold). Must be in cal mode.
+
+    Starts with a single joint Newton step: CDAC takes the bulk of the
+    correction and FDAC (from HZ_PER_FDAC_PRIOR) absorbs the sub-step
+    remainder. The CDAC-only loop is only used if that step misses the
+    coarse threshold.
+
+    Returns:
+        (cdac, fdac, offset_hz)
+    """
     print(f"\n{'='*70}")
     print("PHASE 2 — Coarse DAC correction")
     print(f"{'='*70}")
@@ -285,43 +601,69 @@ def phase2_coarse_correction(fpga, synth, data, offset_hz, hz_per_cdac, cdac, co
               f"({format_deltaf(coarse_threshold_hz)}), skipping.")
         phase['skipped'] = True
         data['phases'].append(phase)
-        return cdac, offset_hz
-
-    fdac = 128  # FDAC stays at midrange during coarse phase
+        return cdac, 128, offset_hz
+
+    fdac = 128  # phase 1 leaves FDAC at midrange
+    new_cdac, new_fdac, residual_hz = newton_step(offset_hz, hz_per_cdac, cdac, fdac)
+    print(f"\n  Newton step: offset={format_deltaf(offset_hz)} → CDAC={new_cdac}, FDAC={new_fdac}")
+
+    last_seq = set_dac_and_settle(
+        fpga, synth, cdac=new_cdac, fdac=new_fdac, prev_cdac=cdac, prev_fdac=fdac)
+    mean_hz, std_hz, _ = measure_offset(
+        fpga, 15, required_se_hz=coarse_threshold_hz / 4,
+        label=f"CDAC={new_cdac},FDAC={new_fdac}", last_seq=last_seq)
+    print(f"    Result: {format_deltaf(mean_hz)} ± {format_deltaf(std_hz)}")
+
+    phase['newton_step'] = {
+        'cdac': new_cdac, 'fdac': new_fdac, 'offset_hz': mean_hz, 'std_hz': std_hz,
+        'predicted_residual_hz': residual_hz,
+    }
+    cdac, fdac, offset_hz = new_cdac, new_fdac, mean_hz
 
+    # Fallback: CDAC-only iterations if the Newton step missed
     for iteration in range(3):
+        if abs(offset_hz) < coarse_threshold_hz:
+            break
+
         correction = round(-offset_hz / hz_per_cdac)
-        new_cdac = int(np.clip(cdac + correction, 0, 255))
+        new_cdac = _clip_u8(cdac + correction)
         print(f"\n  Iteration {iteration + 1}: offset={format_deltaf(offset_hz)}, "
               f"correction={correction:+d} → CDAC={new_cdac}")
 
-        set_dac_and_settle(synth, cdac=new_cdac)
-        mean_hz, std_hz, _ = measure_offset(fpga, 15, f"CDAC={new_cdac}")
+        last_seq = set_dac_and_settle(fpga, synth, cdac=new_cdac, prev_cdac=cdac)
+        mean_hz, std_hz, _ = measure_offset(
+            fpga, 15, required_se_hz=coarse_threshold_hz / 4, label=f"CDAC={new_cdac}",
+            last_seq=last_seq)
         print(f"    Result: {format_deltaf(mean_hz)} ± {format_deltaf(std_hz)}")
 
         phase['iterations'].append({
-            'cdac': new_cdac, 'offset_hz': mean_hz, 'std_hz': std_hz,
+            'cdac': new_cdac, 'fdac': fdac, 'offset_hz': mean_hz, 'std_hz': std_hz,
             'correction': correction,
         })
 
         cdac = new_cdac
         offset_hz = mean_hz
 
-        if abs(offset_hz) < coarse_threshold_hz:
-            print(f"  Coarse correction converged: {format_deltaf(offset_hz)}")
-            break
+    if abs(offset_hz) < coarse_threshold_hz:
+        print(f"  Coarse correction converged: {format_deltaf(offset_hz)}")
 
     phase['final_cdac'] = cdac
+    phase['final_fdac'] = fdac
     phase['final_offset_hz'] = offset_hz
     data['phases'].append(phase)
-    return cdac, offset_hz
+    return cdac, fdac, offset_hz
 
 
 def phase3_fine_correction(fpga, synth, data, offset_hz, cdac, fdac, target_hz, hz_per_cdac):
-    """Phase 3: Fine DAC correction with CDAC readjustment on saturation.
-
-    Uses 30s measurements for sub-ppb precision (1 FDAC LSB ≈ 0.44 ppb).
-    If FDAC hits a limit (0 or 255), adjusts CDAC by ±1 step and retries.
+    """Phase 3: Fine DAC golden-section search with CDAC readjustment on saturation.
+
+    Uses up to 30s measurements for sub-ppb precision (1 FDAC LSB ≈ 0.44 ppb),
+    stopping early once the standard error is below a third of the target.
+    |offset| is unimodal in FDAC, so the best FDAC is bracketed with one new
+    measurement per step. The bracket is centred on the FDAC predicted from
+    HZ_PER_FDAC_PRIOR, whose estimate is refined by every FDAC step taken.
+    If the best FDAC sits at a limit (0 or 255) and is still off target,
+    adjusts CDAC by ±1 step and retries.
     """
     print(f"\n{'='*70}")
     print("PHASE 3 — Fine DAC correction")
@@ -329,114 +671,144 @@ def phase3_fine_correction(fpga, synth, data, offset_hz, cdac, fdac, target_hz,
 
     FINE_MEAS_S = 30  # longer measurements for sub-ppb precision
     MAX_CDAC_READJUST = 2  # max CDAC readjustments for FDAC saturation
+    SLOPE_FLIP_SIGMA = 5  # opposite-sign FDAC slope is believed beyond this many σ
 
     phase = {'name': 'phase3_fine', 'iterations': [], 'cdac_readjustments': []}
 
-    # Characterize FDAC sensitivity
-    print("  Characterizing FDAC sensitivity...")
-    mean_a, std_a, _ = measure_offset(fpga, FINE_MEAS_S, f"FDAC={fdac}")
-    print(f"    FDAC={fdac}: {format_deltaf(mean_a)}")
-
-    fdac_b = min(fdac + 20, 255)
-    delta_fdac = fdac_b - fdac
-    if delta_fdac == 0:
-        fdac_b = max(fdac - 20, 0)
-        delta_fdac = fdac_b - fdac
-
-    set_dac_and_settle(synth, fdac=fdac_b)
-    mean_b, std_b, _ = measure_offset(fpga, FINE_MEAS_S, f"FDAC={fdac_b}")
-    print(f"    FDAC={fdac_b}: {format_deltaf(mean_b)}")
-
-    hz_per_fdac = (mean_b - mean_a) / delta_fdac
-    phase['hz_per_fdac_step'] = hz_per_fdac
-    print(f"    Sensitivity: {hz_per_fdac:+.6f} Hz/FDAC step ({hz_to_ppb(hz_per_fdac):+.3f} ppb/step)")
+    # FDAC and CDAC normally pull the tuning voltage the same way; start from
+    # that and let the measurements overrule it
+    hz_per_fdac = math.copysign(HZ_PER_FDAC_PRIOR, hz_per_cdac)
+    slope_flipped = False
+    # The incoming offset is a short coarse measurement: it only centres the
+    # first bracket, so convergence always rests on FINE_MEAS_S measurements
+    meas_cache = {}  # (cdac, fdac) → (mean, std, t)
+    last_point = {}  # last measured (fdac, offset) per CDAC
+    applied = {'cdac': cdac, 'fdac': fdac}  # DAC values currently set on the synth
+
+    def measure(c, f, duration_s):
+        """Measure at (CDAC, FDAC), reusing a recent result for the same setting."""
+        nonlocal hz_per_fdac, slope_flipped
+        key = (c, f)
+        if key in meas_cache and time.time() - meas_cache[key][2] < MEAS_CACHE_TTL_S:
+            return meas_cache[key][:2]
+
+        changes = {k: v for k, v in (('cdac', c), ('fdac', f)) if applied[k] != v}
+        last_seq = None
+        if changes:
+            last_seq = set_dac_and_settle(
+                fpga, synth, **changes, prev_cdac=applied['cdac'], prev_fdac=applied['fdac'])
+        applied.update(cdac=c, fdac=f)
+        # Comparisons between neighbouring FDAC values need the SE below one step
+        mean_hz, std_hz, n = measure_offset(
+            fpga, duration_s, required_se_hz=min(target_hz / 3, abs(hz_per_fdac) / 2),
+            label=f"CDAC={c},FDAC={f}", last_seq=last_seq)
+        print(f"    FDAC={f}: {format_deltaf(mean_hz)} ± {format_deltaf(std_hz)}")
+        meas_cache[key] = (mean_hz, std_hz, time.time())
+        phase['iterations'].append({
+            'cdac': c, 'fdac': f, 'offset_hz': mean_hz, 'std_hz': std_hz,
+            'method': 'golden_section',
+        })
 
-    if abs(hz_per_fdac) < 1e-6:
-        print("  WARNING: FDAC sensitivity too low, cannot calibrate fine DAC")
-        data['phases'].append(phase)
-        return cdac, fdac, mean_a
+        # Large enough FDAC steps refine the sensitivity. A slope of the other
+        # sign replaces it outright, but only when the change is well above noise.
+        se_hz = std_hz / math.sqrt(n)
+        prev = last_point.get(c)
+        if prev is not None and abs(f - prev[0]) >= 5:
+            slope = (mean_hz - prev[1]) / (f - prev[0])
+            if slope * hz_per_fdac > 0:
+                hz_per_fdac = 0.7 * hz_per_fdac + 0.3 * slope
+            elif abs(mean_hz - prev[1]) > SLOPE_FLIP_SIGMA * math.hypot(se_hz, prev[2]):
+                hz_per_fdac = slope
+                slope_flipped = True
+        last_point[c] = (f, mean_hz, se_hz)
+        return mean_hz, std_hz
+
+    def measure_or_abort(value):
+        mean_hz = measure(cdac, value, FINE_MEAS_S)[0]
+        if slope_flipped and abs(mean_hz) >= target_hz:
+            raise _SlopeSignFlipped
+        return mean_hz
+
+    def search(lo, hi):
+        print(f"\n  Golden-section search over FDAC [{lo}, {hi}] at CDAC={cdac}...")
+        known = {f: m for (c, f), (m, _, t) in meas_cache.items()
+                 if c == cdac and time.time() - t < MEAS_CACHE_TTL_S}
+        try:
+            return golden_section_fdac(
+                measure_or_abort, target_hz,
+                lo=lo, hi=hi, known=known, slope_sign=1 if hz_per_fdac > 0 else -1)
+        except _SlopeSignFlipped:
+            # Stop here; the caller re-centres with the corrected slope
+            best = min((f for c, f in meas_cache if c == cdac),
+                       key=lambda f: abs(meas_cache[(cdac, f)][0]))
+            return best, meas_cache[(cdac, best)][0]
 
-    # Restore FDAC
-    set_dac_and_settle(synth, fdac=fdac)
-    offset_hz = mean_a
     cdac_readjust_count = 0
+    recentred = False
+
+    while True:
+        # Bracket the FDAC predicted from the current operating point
+        center = _clip_u8(round(fdac - offset_hz / hz_per_fdac))
+        lo = max(center - FDAC_SEARCH_HALF_WIDTH, 0)
+        hi = min(center + FDAC_SEARCH_HALF_WIDTH, 255)
+        best_fdac, best_offset = search(lo, hi)
+
+        if (not slope_flipped and abs(best_offset) >= target_hz
+                and best_fdac in (lo, hi) and best_fdac not in (0, 255)):
+            # Prediction was off — continue the search beyond that bracket edge
+            best_fdac, best_offset = search(0, lo) if best_fdac == lo else search(hi, 255)
+
+        fdac, offset_hz = best_fdac, best_offset
+        print(f"    Best: FDAC={fdac}, offset={format_deltaf(offset_hz)}")
+
+        if slope_flipped:
+            # The bracket was centred with the wrong sign — redo it once
+            slope_flipped = False
+            if not recentred and abs(offset_hz) >= target_hz:
+                recentred = True
+                phase['fdac_slope_sign_flipped'] = True
+                print(f"  FDAC slope measured as {hz_per_fdac:+.6f} Hz/step, opposite to "
+                      f"the prior — re-centring the search")
+                continue
 
-    for iteration in range(8):  # extra iterations to account for CDAC readjustments
-        correction = round(-offset_hz / hz_per_fdac)
-        unclamped_fdac = fdac + correction
-        new_fdac = int(np.clip(unclamped_fdac, 0, 255))
-
-        # Check if FDAC is being clamped (saturated)
-        if new_fdac != unclamped_fdac and cdac_readjust_count < MAX_CDAC_READJUST:
-            # FDAC range insufficient — readjust CDAC
-            cdac_readjust_count += 1
-            print(f"\n  FDAC saturated (would need {unclamped_fdac}, clamped to {new_fdac})")
-            print(f"  Readjusting CDAC ({cdac_readjust_count}/{MAX_CDAC_READJUST})...")
-
-            # Measure actual offset at the saturated FDAC
-            set_dac_and_settle(synth, fdac=new_fdac)
-            mean_sat, std_sat, _ = measure_offset(fpga, 15, f"FDAC={new_fdac}")
-            print(f"    Offset at FDAC={new_fdac}: {format_deltaf(mean_sat)}")
-
-            # Compute CDAC correction for the residual offset
-            cdac_correction = round(-mean_sat / hz_per_cdac)
-            if cdac_correction == 0:
-                cdac_correction = -1 if mean_sat < 0 else 1
-            new_cdac = int(np.clip(cdac + cdac_correction, 0, 255))
-            print(f"    CDAC correction: {cdac_correction:+d} → CDAC={new_cdac}")
-
-            set_dac_and_settle(synth, cdac=new_cdac)
-            phase['cdac_readjustments'].append({
-                'old_cdac': cdac, 'new_cdac': new_cdac,
-                'residual_hz': mean_sat, 'cdac_correction': cdac_correction,
-            })
-            cdac = new_cdac
-
-            # Reset FDAC to midrange and re-measure
-            fdac = 128
-            set_dac_and_settle(synth, fdac=fdac)
-            offset_hz, _, _ = measure_offset(fpga, FINE_MEAS_S, f"CDAC={cdac},FDAC={fdac}")
-            print(f"    After CDAC readjust: CDAC={cdac}, FDAC={fdac}, offset={format_deltaf(offset_hz)}")
-            continue  # retry fine correction with new CDAC
-
-        print(f"\n  Iteration {iteration + 1}: offset={format_deltaf(offset_hz)}, "
-              f"correction={correction:+d} → FDAC={new_fdac}")
-
-        if new_fdac == fdac and abs(offset_hz) > target_hz:
-            # Correction too small for integer step — try both neighbors
-            best_fdac = fdac
-            best_offset = offset_hz
-            for c in [max(fdac - 1, 0), min(fdac + 1, 255)]:
-                set_dac_and_settle(synth, fdac=c)
-                m, _, _ = measure_offset(fpga, FINE_MEAS_S, f"FDAC={c}")
-                if abs(m) < abs(best_offset):
-                    best_fdac = c
-                    best_offset = m
-            fdac = best_fdac
-            offset_hz = best_offset
-            print(f"    Sub-step search: best FDAC={fdac}, offset={format_deltaf(offset_hz)}")
-            set_dac_and_settle(synth, fdac=fdac)
-            phase['iterations'].append({
-                'fdac': fdac, 'offset_hz': offset_hz,
-                'method': 'neighbor_search',
-            })
+        saturated = fdac in (0, 255) and abs(offset_hz) >= target_hz
+        if not saturated or cdac_readjust_count >= MAX_CDAC_READJUST:
             break
 
-        set_dac_and_settle(synth, fdac=new_fdac)
-        mean_hz, std_hz, _ = measure_offset(fpga, FINE_MEAS_S, f"FDAC={new_fdac}")
-        print(f"    Result: {format_deltaf(mean_hz)} ± {format_deltaf(std_hz)}")
-
-        phase['iterations'].append({
-            'fdac': new_fdac, 'offset_hz': mean_hz, 'std_hz': std_hz,
-            'correction': correction,
+        # FDAC range insufficient — readjust CDAC
+        cdac_readjust_count += 1
+        print(f"\n  FDAC saturated at {fdac}, offset={format_deltaf(offset_hz)}")
+        print(f"  Readjusting CDAC ({cdac_readjust_count}/{MAX_CDAC_READJUST})...")
+
+        # Compute CDAC correction for the residual offset
+        cdac_correction = round(-offset_hz / hz_per_cdac)
+        if cdac_correction == 0:
+            # Sub-step residual — one step against the sign of offset × slope
+            cdac_correction = -1 if offset_hz * hz_per_cdac > 0 else 1
+        new_cdac = _clip_u8(cdac + cdac_correction)
+        print(f"    CDAC correction: {cdac_correction:+d} → CDAC={new_cdac}")
+
+        phase['cdac_readjustments'].append({
+            'old_cdac': cdac, 'new_cdac': new_cdac,
+            'residual_hz': offset_hz, 'cdac_correction': cdac_correction,
         })
+        offset_hz += (new_cdac - cdac) * hz_per_cdac  # predicted offset after the CDAC step
+        cdac = new_cdac  # applied together with the next FDAC probe
+
+    # Leave the DACs on the best point found
+    changes = {k: v for k, v in (('cdac', cdac), ('fdac', fdac)) if applied[k] != v}
+    if changes:
+        set_dac_and_settle(
+            fpga, synth, **changes, prev_cdac=applied['cdac'], prev_fdac=applied['fdac'])
+
+    if abs(offset_hz) < target_hz:
+        print(f"  Fine correction converged: {format_deltaf(offset_hz)}")
+    elif fdac not in (0, 255):
+        print(f"\n  WARNING: Fine correction ended off target ({format_deltaf(offset_hz)}, "
+              f"target ±{format_deltaf(target_hz)}) without FDAC saturation")
+    print(f"    Sensitivity: {hz_per_fdac:+.6f} Hz/FDAC step ({hz_to_ppb(hz_per_fdac):+.3f} ppb/step)")
 
-        fdac = new_fdac
-        offset_hz = mean_hz
-
-        if abs(offset_hz) < target_hz:
-            print(f"  Fine correction converged: {format_deltaf(offset_hz)}")
-            break
+    phase['hz_per_fdac_prior_updated'] = hz_per_fdac  # seed for future runs
 
     phase['final_cdac'] = cdac
     phase['final_fdac'] = fdac
@@ -445,7 +817,8 @@ def phase3_fine_correction(fpga, synth, data, offset_hz, cdac, fdac, target_hz,
     return cdac, fdac, offset_hz
 
 
-def phase4_save_and_verify(fpga, synth, data, cdac, fdac, auto_save):
+def phase4_save_and_verify(fpga, synth, data, cdac, fdac, auto_save,
+                           cross_check_freqs=CROSS_CHECK_FREQS):
     """Phase 4: Save to EEPROM then verify.
 
     cal_fst_quit() restores old DAC values, so we must save FIRST,
@@ -483,7 +856,7 @@ def phase4_save_and_verify(fpga, synth, data, cdac, fdac, auto_save):
     synth.set_frequency(MEASURE_FREQ_HZ)
     synth.set_clock_internal()
     time.sleep(2.0)
-    mean_int, std_int, n_int = measure_offset(fpga, 60, "INT verify")
+    mean_int, std_int, n_int = measure_offset(fpga, 60, label="INT verify")
     ppb_final = hz_to_ppb(mean_int)
     print(f"    INT offset: {format_deltaf(mean_int)} ± {format_deltaf(std_int)}"
           f" = {ppb_final:+.1f} ppb (n={n_int})")
@@ -493,19 +866,19 @@ def phase4_save_and_verify(fpga, synth, data, cdac, fdac, auto_save):
     print("\n  EXT10DIR control measurement, 15s...")
     synth.set_clock_external_10mhz_direct()
     time.sleep(2.0)
-    mean_ext, std_ext, n_ext = measure_offset(fpga, 15, "EXT control")
+    mean_ext, std_ext, n_ext = measure_offset(fpga, 15, label="EXT control")
     print(f"    EXT10DIR: {format_deltaf(mean_ext)} ± {format_deltaf(std_ext)} (n={n_ext})")
     phase['ext_control'] = {'mean_hz': mean_ext, 'std_hz': std_ext, 'n': n_ext}
+    save_ext_ref_state(mean_ext, std_ext)
 
-    # Cross-check at other frequencies
-    for check_freq in [110e6, 10e6]:
+    # Cross-check at other frequencies — only the frequency changes between checks
+    synth.set_clock_internal()
+    time.sleep(1.0)
+    for check_freq in cross_check_freqs:
         print(f"\n  Cross-check at {check_freq/1e6:.0f} MHz (INT), 15s...")
-        synth.set_clock_internal()
-        time.sleep(1.0)
         synth.set_frequency(check_freq)
         time.sleep(2.0)
-        flush_history(fpga)
-        mean_ck, std_ck, n_ck = measure_offset(fpga, 15, f"{check_freq/1e6:.0f}MHz")
+        mean_ck, std_ck, n_ck = measure_offset(fpga, 15, label=f"{check_freq/1e6:.0f}MHz")
         expected_df = check_freq - MEASURE_FREQ_HZ
         measured_ppm = (mean_ck - expected_df) / check_freq * 1e6
         print(f"    {check_freq/1e6:.0f} MHz: delta_f={format_deltaf(mean_ck)}, "
@@ -564,7 +937,7 @@ def print_summary(data):
 
 # ── Main calibration routine ─────────────────────────────────────────
 
-def run_calibration(fpga, synth, synth_idn, args):
+def run_calibration(fpga, synth, synth_idn, args, synth_cal_date=None):
     """Execute the full calibration procedure."""
     filepath = generate_data_path()
     target_hz = ppb_to_hz(args.target_ppb)
@@ -574,6 +947,7 @@ def run_calibration(fpga, synth, synth_idn, args):
         'metadata': {
             'start_utc': datetime.now(timezone.utc).isoformat(),
             'synth_idn': synth_idn,
+            'synth_cal_date': synth_cal_date,
             'measure_freq_hz': MEASURE_FREQ_HZ,
             'target_ppb': args.target_ppb,
             'target_hz': target_hz,
@@ -601,7 +975,8 @@ def run_calibration(fpga, synth, synth_idn, args):
         time.sleep(1.0)
 
         # Phase 0 — verification (outside cal mode)
-        offset_hz, ppb_initial = phase0_verify(fpga, synth, data)
+        offset_hz, ppb_initial = phase0_verify(
+            fpga, synth, data, use_ext_cache=not args.recheck_ext)
         save_data(data, filepath)
 
         if args.measure_only:
@@ -636,26 +1011,30 @@ def run_calibration(fpga, synth, synth_idn, args):
         save_data(data, filepath)
 
         if args.dry_run:
-            cdac_correction = round(-offset_hz / hz_per_cdac)
-            planned_cdac = int(np.clip(cdac + cdac_correction, 0, 255))
-            print(f"\n  DRY RUN — Would set CDAC={planned_cdac} (correction {cdac_correction:+d})")
-            print(f"           Then fine-tune FDAC around 128")
+            # Same starting point phase 2 would apply
+            if abs(offset_hz) < coarse_threshold_hz:
+                planned_cdac, planned_fdac = cdac, 128
+            else:
+                planned_cdac, planned_fdac, _ = newton_step(offset_hz, hz_per_cdac, cdac, 128)
+            cdac_correction = planned_cdac - cdac
+            print(f"\n  DRY RUN — Would set CDAC={planned_cdac} (correction {cdac_correction:+d}), "
+                  f"FDAC={planned_fdac}")
+            print(f"           Then fine-tune FDAC around {planned_fdac}")
             synth.cal_fst_quit()
             in_cal_mode = False
             data['result'] = {
-                'dry_run': True, 'planned_cdac': planned_cdac,
+                'dry_run': True, 'planned_cdac': planned_cdac, 'planned_fdac': planned_fdac,
                 'cdac_correction': cdac_correction, 'saved': False,
             }
             save_data(data, filepath)
             return data
 
         # Phase 2 — coarse correction (in cal mode)
-        cdac, offset_hz = phase2_coarse_correction(
+        cdac, fdac, offset_hz = phase2_coarse_correction(
             fpga, synth, data, offset_hz, hz_per_cdac, cdac, coarse_threshold_hz)
         save_data(data, filepath)
 
-        # Phase 3 — fine correction (in cal mode, FDAC starts at 128)
-        fdac = 128
+        # Phase 3 — fine correction (in cal mode, from phase 2's CDAC/FDAC)
         cdac, fdac, offset_hz = phase3_fine_correction(
             fpga, synth, data, offset_hz, cdac, fdac, target_hz, hz_per_cdac)
         save_data(data, filepath)
@@ -663,7 +1042,7 @@ def run_calibration(fpga, synth, synth_idn, args):
         # Phase 4 — save EEPROM (from cal mode) then verify
         # Note: cal_fst_quit() restores old DAC values, so we must save first
         saved, mean_final, ppb_final = phase4_save_and_verify(
-            fpga, synth, data, cdac, fdac, args.auto_save)
+            fpga, synth, data, cdac, fdac, args.auto_save, args.cross_check_freqs)
         in_cal_mode = False  # cal_fst_save() exits cal mode
 
         if not saved:
@@ -709,6 +1088,14 @@ def run_calibration(fpga, synth, synth_idn, args):
 
 # ── CLI ──────────────────────────────────────────────────────────────
 
+def parse_freq_list(text):
+    """Parse a comma-separated list of frequencies in Hz (e.g. '50e6,110e6')."""
+    try:
+        return tuple(float(f) for f in text.split(',') if f.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid frequency list: {text!r}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="IFR 2023A Frequency Standard Calibration via Alpha250",
@@ -720,6 +1107,8 @@ Examples:
   %(prog)s --dry-run                Plan without executing
   %(prog)s --auto-save              Save without confirmation
   %(prog)s --target-ppb 50          Tighter convergence target
+  %(prog)s --cross-check-freqs 50e6,110e6
+                                    Custom phase 4 cross-check frequencies
 
 Requires Level 2 unlock: UTIL 80, password 123456
 """,
@@ -738,6 +1127,11 @@ Requires Level 2 unlock: UTIL 80, password 123456
                         help='Characterize sensitivity but do not correct')
     parser.add_argument('--measure-only', action='store_true',
                         help='Only measure current offset, no calibration')
+    parser.add_argument('--recheck-ext', action='store_true',
+                        help='Always re-measure the EXT10DIR reference (ignore the 24 h cache)')
+    parser.add_argument('--cross-check-freqs', type=parse_freq_list, default=CROSS_CHECK_FREQS,
+                        help='Comma-separated cross-check frequencies in Hz '
+                             '(default: 110e6,10e6)')
     args = parser.parse_args()
 
     print(f"\nIFR 2023A Frequency Standard Calibration")
@@ -751,10 +1145,10 @@ Requires Level 2 unlock: UTIL 80, password 123456
     print("\nConnecting to instruments...")
     fpga = connect_fpga(args.host, args.port)
     print(f"  FPGA: connected to {args.host}")
-    synth, synth_idn = connect_synth(args.synth_port)
+    synth, synth_idn, synth_cal_date = connect_synth(args.synth_port)
 
     try:
-        run_calibration(fpga, synth, synth_idn, args)
+        run_calibration(fpga, synth, synth_idn, args, synth_cal_date)
     finally:
         try:
             synth.close()
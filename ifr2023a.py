@@ -13,8 +13,13 @@ Cable: null-modem (crossed TXD/RXD, 9-pin female to 9-pin female)
 Reference: Operating Manual 46882/373 - Chapter 5 (Remote Operation)
 """
 
+import contextlib
+import queue
+import select
 import serial
+import threading
 import time
+from concurrent.futures import Future
 
 
 class IFR2023A:
@@ -33,7 +38,42 @@ class IFR2023A:
     FSTD_EXT_10MHZ_INDIRECT = "EXT10IND"
     FSTD_INTERNAL_10MHZ_OUT = "INT10OUT"
 
-    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, timeout=2):
+    # Pre-encoded constant commands
+    _CLS = b"*CLS\n"
+    _CFRQ_UP = b"CFRQ:UP\n"
+    _CFRQ_DN = b"CFRQ:DN\n"
+    _RFLV_UP = b"RFLV:UP\n"
+    _RFLV_DN = b"RFLV:DN\n"
+    _RFLV_ON = b"RFLV:ON\n"
+    _RFLV_OFF = b"RFLV:OFF\n"
+    _OUTPUT_ENABLE = b"OUTPUT:ENABLE\n"
+    _OUTPUT_DISABLE = b"OUTPUT:DISABLE\n"
+    _SWEEP_GO = b"SWEEP:GO\n"
+    _SWEEP_HALT = b"SWEEP:HALT\n"
+    _SWEEP_RESET = b"SWEEP:RESET\n"
+    _ERROR_Q = b"ERROR?\n"
+
+    # FSTD argument for each frequency standard mode
+    _CLOCK_CMDS = {
+        FSTD_INTERNAL: b"INT",
+        FSTD_EXT_10MHZ_DIRECT: b"EXT10DIR",
+        FSTD_EXT_1MHZ_INDIRECT: b"EXT1IND",
+        FSTD_EXT_10MHZ_INDIRECT: b"EXT10IND",
+        FSTD_INTERNAL_10MHZ_OUT: b"INT10OUT",
+    }
+
+    OPC_TIMEOUT_S = 5.0  # longest wait for *OPC? after a slow command
+
+    # (threshold, divisor, unit) for frequency arguments, largest first
+    _FREQ_UNITS = (
+        (1e9, 1e9, b"GHZ"),
+        (1e6, 1e6, b"MHZ"),
+        (1e3, 1e3, b"KHZ"),
+        (0.0, 1.0, b"HZ"),
+    )
+
+    def __init__(self, port="/dev/ttyUSB0", baudrate=9600, timeout=2, low_latency=True,
+                 min_gap_s=0.0):
         """
         Open RS-232 connection to the IFR 2023A.
 
@@ -41,28 +81,52 @@ class IFR2023A:
             port: Serial port device (e.g. /dev/ttyUSB0, COM3)
             baudrate: Baud rate (max 9600 for this instrument)
             timeout: Read timeout in seconds
+            low_latency: Put the port in low-latency mode (Linux: sets
+                ASYNC_LOW_LATENCY, which drops the FTDI latency timer from
+                16 ms to 1 ms). On Windows set the FTDI driver's
+                "Latency Timer" in Device Manager instead.
+            min_gap_s: Minimum time from the start of one command to the next,
+                for setups that need extra parsing time (0 = none). The
+                time spent clocking the command out counts towards it.
         """
-        self.ser = serial.Serial(
-            port=port,
-            baudrate=baudrate,
-            bytesize=serial.EIGHTBITS,
-            parity=serial.PARITY_NONE,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=timeout,
-            xonxoff=False,
-            rtscts=False,
-        )
-        time.sleep(0.1)
-        # Go to remote mode
-        self.ser.write(self.CTRL_REMOTE)
-        time.sleep(0.1)
-        # Flush any pending data
+        # Configure before opening so DTR/RTS are never asserted: no
+        # hardware handshake is used, and toggling them can make some
+        # USB-serial bridges emit a burst of junk.
+        self.ser = serial.Serial()
+        self.ser.port = port
+        self.ser.baudrate = baudrate
+        self.ser.bytesize = serial.EIGHTBITS
+        self.ser.parity = serial.PARITY_NONE
+        self.ser.stopbits = serial.STOPBITS_ONE
+        self.ser.timeout = timeout
+        self.ser.xonxoff = False
+        self.ser.rtscts = False
+        self.ser.dsrdtr = False
+        self.ser.dtr = False
+        self.ser.rts = False
+        self.ser.open()
+        self._byte_time = 10.0 / baudrate  # start + 8 data + stop bits
+        self._min_gap = min_gap_s
+        self._batch = None  # pending commands while inside pipeline()
+        self._late_reply = None  # query we gave up on whose reply may still arrive
+        self._opc_ok = True  # cleared if the firmware never answers *OPC?
+        if hasattr(self.ser, "set_buffer_size"):
+            self.ser.set_buffer_size(rx_size=4096)  # Windows only
+        if low_latency:
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (AttributeError, OSError, ValueError, NotImplementedError):
+                pass  # not POSIX, or driver/permissions do not allow it
+        # Drop anything left over from a previous session, then go remote
         self.ser.reset_input_buffer()
+        self.ser.reset_output_buffer()
+        self.ser.write(self.CTRL_REMOTE)
+        self.ser.flush()
 
     def close(self):
         """Return to local mode and close the connection."""
         self.ser.write(self.CTRL_LOCAL)
-        time.sleep(0.05)
+        self.ser.flush()  # let ^D leave the UART before closing
         self.ser.close()
 
     def __enter__(self):
@@ -73,21 +137,184 @@ class IFR2023A:
 
     # ── Low-level communication ──────────────────────────────────────
 
-    def write(self, command: str):
-        """Send a command string (newline terminator added automatically)."""
-        msg = command.strip() + "\n"
-        self.ser.write(msg.encode("ascii"))
-        time.sleep(0.05)
+    def write_str(self, command: str):
+        """Send a command string (newline terminator added automatically).
+
+        Inside pipeline() the command is queued instead of sent.
+        """
+        self.write_bytes((command.strip() + "\n").encode("ascii"))
+
+    write = write_str
+
+    def write_bytes(self, msg: bytes):
+        """Send an already encoded, newline-terminated command as is."""
+        if self._batch is not None:
+            self._batch.append(msg)
+            return
+        self._transmit(msg)
+
+    def _transmit(self, msg: bytes):
+        """Write raw bytes and block until they have left the UART."""
+        self.ser.write(msg)
+        self.ser.flush()
+        if self._min_gap:
+            time.sleep(max(0.0, self._min_gap - len(msg) * self._byte_time))
+
+    def _send_batch(self, cmds: list):
+        """Send several encoded, newline-terminated commands in one serial write."""
+        self._transmit(b"".join(cmds))
+
+    def _format_freq(self, hz: float) -> bytes:
+        """Format a frequency with the largest unit that keeps it >= 1.
+
+        %.12g keeps 1 Hz resolution up to the instrument's 2.05 GHz limit.
+        """
+        for threshold, divisor, unit in self._FREQ_UNITS:
+            if abs(hz) >= threshold:
+                return b"%.12g" % (hz / divisor) + unit
+        return b"%.12gHZ" % hz
+
+    def _flush_batch(self):
+        """Send the commands queued so far by pipeline(), if any."""
+        if self._batch:
+            cmds, self._batch = self._batch, []
+            self._send_batch(cmds)
+
+    def sync(self):
+        """Block until every command written so far has been sent.
+
+        Inside pipeline() this sends the commands queued up to now.
+        """
+        self._flush_batch()
+
+    @contextlib.contextmanager
+    def pipeline(self):
+        """Queue write() calls and send them as one serial write on exit.
+
+        Queries inside the block send the queued commands first. If the
+        block raises, commands still queued are dropped, not sent. Nested
+        pipelines join the outer one.
+
+        Example:
+            with gen.pipeline():
+                gen.set_frequency(100e6)
+                gen.set_amplitude(-20)
+                gen.rf_on()
+        """
+        if self._batch is not None:
+            yield self
+            return
+        self._batch = []
+        try:
+            yield self
+        except BaseException:
+            self._batch = None
+            raise
+        cmds, self._batch = self._batch, None
+        if cmds:
+            self._send_batch(cmds)
 
     def read(self) -> str:
         """Read a response line from the instrument."""
-        response = self.ser.readline().decode("ascii").strip()
+        response = self.ser.read_until(b"\n").decode("ascii").strip()
         return response
 
+    def _discard_late_reply(self, timeout=None) -> bool:
+        """Consume the reply to a query we gave up on, so replies stay in step.
+
+        Waits for one full line, at most the read timeout. With a shorter
+        timeout the reply stays marked as late if it has not fully arrived.
+
+        Returns:
+            bool: False if a late reply is still due
+        """
+        if self._late_reply is None:
+            return True
+        if timeout is None:
+            self._late_reply = None
+            self.ser.read_until(b"\n")
+            return True
+        old_timeout = self.ser.timeout
+        self.ser.timeout = timeout
+        try:
+            line = self.ser.read_until(b"\n")
+        finally:
+            self.ser.timeout = old_timeout
+        if line.endswith(b"\n"):
+            self._late_reply = None
+            return True
+        return False
+
+    def read_fixed(self, n: int) -> bytes:
+        """Read exactly n raw bytes (fewer on timeout), for known-length replies."""
+        return self.ser.read(n)
+
     def query(self, command: str) -> str:
-        """Send a query and return the response."""
-        self.write(command)
-        return self.read()
+        """Send a query and return the response.
+
+        Raises:
+            TimeoutError: No reply within the read timeout
+        """
+        self._flush_batch()
+        self._discard_late_reply()
+        msg = (command.strip() + "\n").encode("ascii")
+        self._transmit(msg)
+        return self._read_reply(msg)
+
+    def _read_reply(self, msg: bytes) -> str:
+        """Wait for the reply to msg, waking as soon as its first byte arrives.
+
+        On timeout the reply is marked as late, so the next query first
+        discards it instead of taking it as its own answer.
+        """
+        try:
+            fd = self.ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None  # no selectable handle (Windows): rely on the read timeout
+        if fd is not None:
+            ready, _, _ = select.select([fd], [], [], self.ser.timeout)
+            if not ready:
+                self._late_reply = msg
+                raise TimeoutError(f"No response to {msg.strip().decode('ascii')!r}")
+        line = self.ser.read_until(b"\n")
+        if not line.endswith(b"\n"):
+            self._late_reply = msg  # nothing, or a truncated line whose tail is still due
+            raise TimeoutError(f"No response to {msg.strip().decode('ascii')!r}")
+        return line.decode("ascii").strip()
+
+    def _write_and_wait(self, command: str, fallback_s: float):
+        """Send a slow command and block until the instrument has finished it.
+
+        The command goes out as "<command>;*OPC?", which is answered once
+        it has completed. If *OPC? is not answered within OPC_TIMEOUT_S,
+        later calls fall back to sleeping fallback_s after the command.
+        """
+        if not self._opc_ok:
+            self.write(command)
+            self.sync()  # the wait starts once the command is out
+            time.sleep(fallback_s)
+            return
+        old_timeout = self.ser.timeout
+        self.ser.timeout = self.OPC_TIMEOUT_S
+        try:
+            self.query(f"{command};*OPC?")
+        except TimeoutError:
+            self._opc_ok = False  # already waited longer than fallback_s
+        finally:
+            self.ser.timeout = old_timeout
+
+    def query_multi(self, commands: list) -> list:
+        """Send several queries as one compound command (one round-trip).
+
+        Args:
+            commands: Query strings, e.g. ["*IDN?", "DIAG:CAL:FST:DATE?"]
+
+        Returns:
+            list[str]: One response per query, split on ';' (fewer if the
+            instrument only answered part of the line)
+        """
+        response = self.query(";:".join(commands))
+        return [r.strip() for r in response.split(";")]
 
     # ── Identification ───────────────────────────────────────────────
 
@@ -97,8 +324,7 @@ class IFR2023A:
 
     def reset(self):
         """Reset to factory defaults (*RST)."""
-        self.write("*RST")
-        time.sleep(1)
+        self._write_and_wait("*RST", 1.0)
 
     def options(self) -> str:
         """Query fitted options (*OPT?)."""
@@ -110,12 +336,36 @@ class IFR2023A:
 
     def clear_status(self):
         """Clear all status registers and error queue."""
-        self.write("*CLS")
+        self.write_bytes(self._CLS)
 
     def errors(self) -> str:
         """Read next error from the error queue."""
         return self.query("ERROR?")
 
+    def errors_nowait(self, wait_s: float = 0.05):
+        """Like errors(), but give up after wait_s instead of the read timeout.
+
+        Meant for polling loops. Returns the next error, or None if no
+        reply arrived in time. A reply that turns up later is returned by
+        the next errors_nowait() call (which then sends no new ERROR?), or
+        read and discarded by the next query(). While the reply to some
+        other query is still due, the call spends wait_s on it and may
+        return None without asking.
+        """
+        self._flush_batch()
+        deadline = time.monotonic() + wait_s
+        if self._late_reply != self._ERROR_Q:
+            if not self._discard_late_reply(timeout=wait_s):
+                return None
+            self._transmit(self._ERROR_Q)
+        while time.monotonic() < deadline:
+            if self.ser.in_waiting:
+                self._late_reply = None
+                return self.read()
+            time.sleep(0.001)
+        self._late_reply = self._ERROR_Q
+        return None
+
     # ── Carrier Frequency (CFRQ) ─────────────────────────────────────
 
     def set_frequency(self, frequency_hz: float):
@@ -130,14 +380,7 @@ class IFR2023A:
             set_frequency(1.5e9)      # 1.5 GHz
             set_frequency(9000)       # 9 kHz
         """
-        if frequency_hz >= 1e9:
-            self.write(f"CFRQ:VALUE {frequency_hz / 1e9}GHZ")
-        elif frequency_hz >= 1e6:
-            self.write(f"CFRQ:VALUE {frequency_hz / 1e6}MHZ")
-        elif frequency_hz >= 1e3:
-            self.write(f"CFRQ:VALUE {frequency_hz / 1e3}KHZ")
-        else:
-            self.write(f"CFRQ:VALUE {frequency_hz}HZ")
+        self.write_bytes(b"CFRQ:VALUE " + self._format_freq(frequency_hz) + b"\n")
 
     def get_frequency(self) -> str:
         """Query the current carrier frequency settings."""
@@ -145,20 +388,15 @@ class IFR2023A:
 
     def set_frequency_step(self, step_hz: float):
         """Set the frequency step size for UP/DN commands."""
-        if step_hz >= 1e6:
-            self.write(f"CFRQ:INC {step_hz / 1e6}MHZ")
-        elif step_hz >= 1e3:
-            self.write(f"CFRQ:INC {step_hz / 1e3}KHZ")
-        else:
-            self.write(f"CFRQ:INC {step_hz}HZ")
+        self.write_bytes(b"CFRQ:INC " + self._format_freq(step_hz) + b"\n")
 
     def frequency_up(self):
         """Increase frequency by one step."""
-        self.write("CFRQ:UP")
+        self.write_bytes(self._CFRQ_UP)
 
     def frequency_down(self):
         """Decrease frequency by one step."""
-        self.write("CFRQ:DN")
+        self.write_bytes(self._CFRQ_DN)
 
     # ── RF Level / Amplitude (RFLV) ──────────────────────────────────
 
@@ -189,19 +427,19 @@ class IFR2023A:
 
     def amplitude_up(self):
         """Increase RF level by one step."""
-        self.write("RFLV:UP")
+        self.write_bytes(self._RFLV_UP)
 
     def amplitude_down(self):
         """Decrease RF level by one step."""
-        self.write("RFLV:DN")
+        self.write_bytes(self._RFLV_DN)
 
     def rf_on(self):
         """Turn the RF output ON."""
-        self.write("RFLV:ON")
+        self.write_bytes(self._RFLV_ON)
 
     def rf_off(self):
         """Turn the RF output OFF."""
-        self.write("RFLV:OFF")
+        self.write_bytes(self._RFLV_OFF)
 
     def set_rf_limit(self, limit_dbm: float):
         """Set and enable the RF level limit."""
@@ -213,25 +451,39 @@ class IFR2023A:
 
     # ── Frequency Standard / Clock Reference (FSTD) ──────────────────
 
+    def set_clock(self, mode: str):
+        """
+        Select the frequency standard.
+
+        Args:
+            mode: One of the FSTD_* constants: INT, EXT10DIR, EXT1IND,
+                EXT10IND or INT10OUT
+        """
+        try:
+            arg = self._CLOCK_CMDS[mode]
+        except KeyError:
+            raise ValueError(f"Unknown clock mode {mode!r}") from None
+        self.write_bytes(b"FSTD " + arg + b"\n")
+
     def set_clock_internal(self):
         """Use the internal 10 MHz TCXO."""
-        self.write("FSTD INT")
+        self.set_clock(self.FSTD_INTERNAL)
 
     def set_clock_external_10mhz_direct(self):
         """Use an external 10 MHz reference, direct mode."""
-        self.write("FSTD EXT10DIR")
+        self.set_clock(self.FSTD_EXT_10MHZ_DIRECT)
 
     def set_clock_external_1mhz_indirect(self):
         """Use an external 1 MHz reference, indirect mode."""
-        self.write("FSTD EXT1IND")
+        self.set_clock(self.FSTD_EXT_1MHZ_INDIRECT)
 
     def set_clock_external_10mhz_indirect(self):
         """Use an external 10 MHz reference, indirect mode."""
-        self.write("FSTD EXT10IND")
+        self.set_clock(self.FSTD_EXT_10MHZ_INDIRECT)
 
     def set_clock_internal_10mhz_out(self):
         """Use internal clock and output 10 MHz on the rear panel."""
-        self.write("FSTD INT10OUT")
+        self.set_clock(self.FSTD_INTERNAL_10MHZ_OUT)
 
     def get_clock(self) -> str:
         """Query the current frequency standard setting."""
@@ -282,22 +534,18 @@ class IFR2023A:
             deviation_hz: Deviation in Hz (e.g. 25000 for 25 kHz)
             source: INT, EXTAC, EXTALC, or EXTDC
         """
-        if deviation_hz >= 1e6:
-            self.write(f"FM:DEVN {deviation_hz / 1e6}MHZ;{source};ON")
-        elif deviation_hz >= 1e3:
-            self.write(f"FM:DEVN {deviation_hz / 1e3}KHZ;{source};ON")
-        else:
-            self.write(f"FM:DEVN {deviation_hz}HZ;{source};ON")
+        self.write_bytes(b"FM:DEVN " + self._format_freq(deviation_hz)
+                         + b";%s;ON\n" % source.encode("ascii"))
 
     # ── Output Control ────────────────────────────────────────────────
 
     def output_enable(self):
         """Enable output (apply settings)."""
-        self.write("OUTPUT:ENABLE")
+        self.write_bytes(self._OUTPUT_ENABLE)
 
     def output_disable(self):
         """Disable output (settings can be downloaded without effect)."""
-        self.write("OUTPUT:DISABLE")
+        self.write_bytes(self._OUTPUT_DISABLE)
 
     # ── Memory ────────────────────────────────────────────────────────
 
@@ -340,25 +588,26 @@ class IFR2023A:
             stop_hz: Stop frequency in Hz
             step_time_ms: Time per step in milliseconds
         """
-        self.write(f"CFRQ:MODE FIXED")
-        self.write(f"SWEEP:CFRQ:START {start_hz / 1e6}MHZ")
-        self.write(f"SWEEP:CFRQ:STOP {stop_hz / 1e6}MHZ")
-        self.write(f"SWEEP:CFRQ:TIME {step_time_ms}MS")
-        self.write("SWEEP:MODE CONT")
-        self.write("SWEEP:TYPE LIN")
-        self.write("CFRQ:MODE SWEPT")
+        with self.pipeline():
+            self.write("CFRQ:MODE FIXED")
+            self.write(f"SWEEP:CFRQ:START {start_hz / 1e6}MHZ")
+            self.write(f"SWEEP:CFRQ:STOP {stop_hz / 1e6}MHZ")
+            self.write(f"SWEEP:CFRQ:TIME {step_time_ms}MS")
+            self.write("SWEEP:MODE CONT")
+            self.write("SWEEP:TYPE LIN")
+            self.write("CFRQ:MODE SWEPT")
 
     def sweep_go(self):
         """Start sweep."""
-        self.write("SWEEP:GO")
+        self.write_bytes(self._SWEEP_GO)
 
     def sweep_halt(self):
         """Pause sweep."""
-        self.write("SWEEP:HALT")
+        self.write_bytes(self._SWEEP_HALT)
 
     def sweep_reset(self):
         """Reset sweep to start value."""
-        self.write("SWEEP:RESET")
+        self.write_bytes(self._SWEEP_RESET)
 
     # ── Frequency Standard Calibration (DIAG:CAL:FST) ────────────────
     # Requires Level 2 unlock via front panel: UTIL 80, password 123456
@@ -371,8 +620,7 @@ class IFR2023A:
         RF output should be turned OFF before calling this to avoid
         feeding 1200 MHz into the ADC.
         """
-        self.write("DIAG:CAL:FST:INIT")
-        time.sleep(1.0)  # PLL reconfiguration
+        self._write_and_wait("DIAG:CAL:FST:INIT", 1.0)  # PLL reconfiguration
 
     def cal_fst_set_coarse_dac(self, value: int):
         """Set the coarse DAC for TCXO tuning.
@@ -382,7 +630,7 @@ class IFR2023A:
         """
         if not 0 <= value <= 255:
             raise ValueError(f"Coarse DAC value {value} out of range [0, 255]")
-        self.write(f"DIAG:CAL:FST:CDAC {value}")
+        self.write_bytes(b"DIAG:CAL:FST:CDAC %d\n" % value)
 
     def cal_fst_set_fine_dac(self, value: int):
         """Set the fine DAC for TCXO tuning.
@@ -392,7 +640,54 @@ class IFR2023A:
         """
         if not 0 <= value <= 255:
             raise ValueError(f"Fine DAC value {value} out of range [0, 255]")
-        self.write(f"DIAG:CAL:FST:FDAC {value}")
+        self.write_bytes(b"DIAG:CAL:FST:FDAC %d\n" % value)
+
+    def cal_fst_set_dacs(self, coarse: int, fine: int):
+        """Set both coarse and fine DACs with a single compound command.
+
+        Saves one serial round-trip compared to two separate writes.
+
+        Args:
+            coarse: Coarse DAC value 0-255
+            fine: Fine DAC value 0-255
+        """
+        if not 0 <= coarse <= 255:
+            raise ValueError(f"Coarse DAC value {coarse} out of range [0, 255]")
+        if not 0 <= fine <= 255:
+            raise ValueError(f"Fine DAC value {fine} out of range [0, 255]")
+        self.write_bytes(b"DIAG:CAL:FST:CDAC %d;:DIAG:CAL:FST:FDAC %d\n" % (coarse, fine))
+
+    def cal_fst_sweep_coarse(self, values, on_each) -> list:
+        """Step the coarse DAC through values, calling on_each after each one.
+
+        Args:
+            values: DAC values 0-255, in the order to apply them
+            on_each: Callback taking the DAC value just set, e.g. to read
+                an external counter; it is responsible for any settling.
+                Each DAC command has been sent before on_each is called,
+                also inside pipeline() and on IFR2023AAsync.
+
+        Returns:
+            list: on_each's return values, one per DAC value
+        """
+        return self._cal_fst_sweep(b"DIAG:CAL:FST:CDAC %d\n", "Coarse", values, on_each)
+
+    def cal_fst_sweep_fine(self, values, on_each) -> list:
+        """Step the fine DAC through values; see cal_fst_sweep_coarse()."""
+        return self._cal_fst_sweep(b"DIAG:CAL:FST:FDAC %d\n", "Fine", values, on_each)
+
+    def _cal_fst_sweep(self, template: bytes, name: str, values, on_each) -> list:
+        values = list(values)
+        for v in values:
+            if not 0 <= v <= 255:
+                raise ValueError(f"{name} DAC value {v} out of range [0, 255]")
+        cmds = [template % v for v in values]
+        results = []
+        for cmd, v in zip(cmds, values):
+            self.write_bytes(cmd)
+            self.sync()  # on_each must see this value, not the previous one
+            results.append(on_each(v))
+        return results
 
     def cal_fst_get_coarse_dac(self) -> int:
         """Query current coarse DAC value.
@@ -416,16 +711,14 @@ class IFR2023A:
         This writes the current CDAC/FDAC values to non-volatile memory
         and returns the synthesizer to normal operation.
         """
-        self.write("DIAG:CAL:FST:SAVE")
-        time.sleep(2.0)  # EEPROM write + PLL reconfiguration
+        self._write_and_wait("DIAG:CAL:FST:SAVE", 2.0)  # EEPROM write + PLL reconfiguration
 
     def cal_fst_quit(self):
         """Exit calibration mode without saving.
 
         Discards any DAC changes and returns to normal operation.
         """
-        self.write("DIAG:CAL:FST:QUIT")
-        time.sleep(1.0)  # PLL reconfiguration
+        self._write_and_wait("DIAG:CAL:FST:QUIT", 1.0)  # PLL reconfiguration
 
     def cal_fst_get_date(self) -> str:
         """Query the date of last frequency standard calibration.
@@ -446,6 +739,85 @@ class IFR2023A:
         return self.query(cmd)
 
 
+class IFR2023AAsync(IFR2023A):
+    """IFR2023A that does its serial I/O on a background thread.
+
+    Writes return as soon as they are queued; queries wait for their reply
+    (or use query_async() to get a Future). A single worker drains a FIFO
+    queue, so commands reach the instrument in call order. An error from a
+    queued write is raised by the next call.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._queue = queue.Queue()
+        self._error = None
+        super().__init__(*args, **kwargs)
+        self._worker = threading.Thread(target=self._worker_loop,
+                                        name="ifr2023a-io", daemon=True)
+        self._worker.start()
+
+    def _worker_loop(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                msg, fut = item
+                if fut is not None and not fut.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if fut is not None:
+                        self._discard_late_reply()
+                    IFR2023A._transmit(self, msg)
+                    if fut is not None:
+                        fut.set_result(self._read_reply(msg))
+                except Exception as e:
+                    if fut is not None:
+                        fut.set_exception(e)
+                    else:
+                        self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_pending(self):
+        err, self._error = self._error, None
+        if err is not None:
+            raise err
+
+    def _transmit(self, msg: bytes):
+        self._raise_pending()
+        self._queue.put((msg, None))
+
+    def query_async(self, command: str) -> Future:
+        """Queue a query and return a Future for its response."""
+        self._flush_batch()
+        self._raise_pending()
+        fut = Future()
+        self._queue.put(((command.strip() + "\n").encode("ascii"), fut))
+        return fut
+
+    def query(self, command: str) -> str:
+        """Send a query and return the response."""
+        return self.query_async(command).result()
+
+    def errors_nowait(self, wait_s: float = 0.05):
+        """As IFR2023A.errors_nowait(), once the queue has drained."""
+        self.sync()
+        return super().errors_nowait(wait_s)
+
+    def sync(self):
+        """Block until every queued command has been sent."""
+        self._flush_batch()
+        self._queue.join()
+        self._raise_pending()
+
+    def close(self):
+        """Send what is still queued, stop the worker, then close."""
+        self._queue.put(None)
+        self._worker.join()
+        super().close()
+
+
 # ── Demo / CLI ────────────────────────────────────────────────────────
 
 def main():
@@ -480,7 +852,7 @@ Examples:
 
     parser.add_argument(
         "--clock",
-        choices=["INT", "EXT10DIR", "EXT1IND", "EXT10IND", "INT10OUT"],
+        choices=list(IFR2023A._CLOCK_CMDS),
         help="Set frequency standard (clock reference)",
     )
     parser.add_argument("--clock-query", action="store_true", help="Query clock reference")
@@ -489,6 +861,8 @@ Examples:
     parser.add_argument("--query", type=str, help="Send a raw query and print response")
 
     args = parser.parse_args()
+    n_settings = sum(map(bool, [args.freq is not None, args.amp is not None,
+                                args.clock, args.rf_on, args.rf_off]))
 
     with IFR2023A(port=args.port, baudrate=args.baud) as gen:
 
@@ -499,39 +873,46 @@ Examples:
             gen.reset()
             print("Reset done.")
 
-        if args.freq is not None:
-            gen.set_frequency(args.freq)
-            print(f"Frequency set to {args.freq} Hz")
+        # Settings go out in one write; with several of them the output is
+        # disabled meanwhile so they all take effect together.
+        done = []
+        with gen.pipeline():
+            if n_settings > 1:
+                gen.output_disable()
+
+            if args.freq is not None:
+                gen.set_frequency(args.freq)
+                done.append(f"Frequency set to {args.freq} Hz")
+
+            if args.amp is not None:
+                gen.set_amplitude(args.amp)
+                done.append(f"Amplitude set to {args.amp} dBm")
+
+            if args.clock:
+                gen.set_clock(args.clock)
+                done.append(f"Clock set to {args.clock}")
+
+            if args.rf_on:
+                gen.rf_on()
+                done.append("RF output ON")
+
+            if args.rf_off:
+                gen.rf_off()
+                done.append("RF output OFF")
+
+            if n_settings > 1:
+                gen.output_enable()
+
+        # Only report once the batch has actually been written
+        for msg in done:
+            print(msg)
 
         if args.freq_query:
             print(f"Frequency: {gen.get_frequency()}")
 
-        if args.amp is not None:
-            gen.set_amplitude(args.amp)
-            print(f"Amplitude set to {args.amp} dBm")
-
         if args.amp_query:
             print(f"Amplitude: {gen.get_amplitude()}")
 
-        if args.rf_on:
-            gen.rf_on()
-            print("RF output ON")
-
-        if args.rf_off:
-            gen.rf_off()
-            print("RF output OFF")
-
-        if args.clock:
-            clock_methods = {
-                "INT": gen.set_clock_internal,
-                "EXT10DIR": gen.set_clock_external_10mhz_direct,
-                "EXT1IND": gen.set_clock_external_1mhz_indirect,
-                "EXT10IND": gen.set_clock_external_10mhz_indirect,
-                "INT10OUT": gen.set_clock_internal_10mhz_out,
-            }
-            clock_methods[args.clock]()
-            print(f"Clock set to {args.clock}")
-
         if args.clock_query:
             print(f"Clock: {gen.get_clock()}")
 